@@ -27,6 +27,8 @@ class AuditConfig:
     storage_connection_string: str = ""   # Azure Storage connection string (from Key Vault)
     storage_container: str = "audit-logs"
     retention_days: int = 365
+    blob_retry_total: int = 3  # SDK retries for transient upload failures
+    blob_retry_backoff: float = 1.0  # seconds — initial exponential backoff
 
     # Redacted logging mode (Issue #65)
     redact_pii: bool = False  # When True, scrub PII from blob records before upload
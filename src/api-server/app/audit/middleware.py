@@ -18,8 +18,9 @@ import hashlib
 import json
 import logging
 import time
-from typing import AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional
 
+import orjson
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response, StreamingResponse
@@ -34,10 +35,27 @@ _AUDITED_PREFIXES = ("/v1/", "/api/v1/")
 # Paths explicitly excluded (health probes, metrics, docs)
 _EXCLUDED_PATHS = frozenset({"/healthz", "/readyz", "/metrics", "/docs", "/openapi.json"})
 
+# Inference endpoints → modality.  Exact path lookup rather than substring
+# checks, so native paths that merely contain a keyword (e.g. a model named
+# "bge-embeddings" under /api/v1/models/) are not mislabelled.
+_MODALITY_BY_PATH: dict[str, str] = {
+    "/v1/chat/completions": "chat",
+    "/v1/embeddings": "embedding",
+    "/v1/audio/transcriptions": "transcription",
+}
+
 # Max body size to capture (prevent OOM on huge payloads)
 _MAX_BODY_CAPTURE_BYTES = 1_048_576  # 1 MB
 
 
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson, falling back to stdlib json (NaN, lone surrogates)."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
 def _hash_ip(ip: str) -> str:
     """One-way hash of client IP for privacy compliance."""
     return hashlib.sha256(ip.encode("utf-8")).hexdigest()[:16]
@@ -47,18 +65,12 @@ def _should_audit(path: str) -> bool:
     """Decide whether a request path should generate an audit record."""
     if path in _EXCLUDED_PATHS:
         return False
-    return any(path.startswith(prefix) for prefix in _AUDITED_PREFIXES)
+    return path.startswith(_AUDITED_PREFIXES)
 
 
 def _extract_modality(path: str) -> Optional[str]:
     """Infer modality from request path."""
-    if "chat/completions" in path:
-        return "chat"
-    if "embeddings" in path:
-        return "embedding"
-    if "audio/transcriptions" in path:
-        return "transcription"
-    return None
+    return _MODALITY_BY_PATH.get(path.rstrip("/"))
 
 
 def _count_input_tokens_estimate(body: dict) -> tuple[int, int]:
@@ -99,7 +111,7 @@ def _count_input_tokens_estimate(body: dict) -> tuple[int, int]:
 def _extract_output_tokens(response_body: str) -> tuple[int, Optional[str]]:
     """Extract output token count and finish reason from response JSON."""
     try:
-        data = json.loads(response_body)
+        data = orjson.loads(response_body)
         usage = data.get("usage", {})
         output_tokens = usage.get("completion_tokens", 0) or usage.get("total_tokens", 0)
         finish_reason = None
@@ -107,7 +119,7 @@ def _extract_output_tokens(response_body: str) -> tuple[int, Optional[str]]:
         if choices:
             finish_reason = choices[0].get("finish_reason")
         return (output_tokens, finish_reason)
-    except (json.JSONDecodeError, TypeError, AttributeError):
+    except (orjson.JSONDecodeError, TypeError, AttributeError):
         return (0, None)
 
 
@@ -133,7 +145,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 body_bytes = await request.body()
                 if len(body_bytes) <= _MAX_BODY_CAPTURE_BYTES:
                     try:
-                        request_body = json.loads(body_bytes)
+                        request_body = _loads(body_bytes)
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         request_body = None
         except Exception:
@@ -191,7 +203,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                         for line in chunk_str.split("\n"):
                             if line.startswith("data: ") and line.strip() != "data: [DONE]":
                                 try:
-                                    chunk_data = json.loads(line[6:])
+                                    chunk_data = orjson.loads(line[6:])
                                     for choice in chunk_data.get("choices", []):
                                         delta = choice.get("delta", {})
                                         if delta.get("content"):
@@ -199,7 +211,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
                                         fr = choice.get("finish_reason")
                                         if fr:
                                             finish_reason = fr
-                                except (json.JSONDecodeError, KeyError):
+                                except (orjson.JSONDecodeError, KeyError):
                                     pass
 
                         yield chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
@@ -23,12 +23,17 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
 from app.audit.config import AuditConfig
 from app.audit.redaction import redact_blob_dict
 from app.audit.schemas import AuditRecord
 
 logger = logging.getLogger("directai.audit")
 
+# Max concurrent blob uploads per flushed batch.
+_BLOB_UPLOAD_CONCURRENCY = 16
+
 # ── SQL ─────────────────────────────────────────────────────────────
 
 _CREATE_TABLE_SQL = """
@@ -137,8 +142,14 @@ class AuditWriter:
         if self._config.blob_enabled and self._config.storage_connection_string:
             try:
                 from azure.storage.blob.aio import BlobServiceClient
+                # Transient failures (timeouts, 503s) are retried by the SDK's
+                # exponential retry policy.  Its default backoff starts at 15s,
+                # which would stall the flush loop; start small instead.
                 blob_service = BlobServiceClient.from_connection_string(
                     self._config.storage_connection_string,
+                    retry_total=self._config.blob_retry_total,
+                    initial_backoff=self._config.blob_retry_backoff,
+                    increment_base=2,
                 )
                 self._blob_container_client = blob_service.get_container_client(
                     self._config.storage_container,
@@ -258,11 +269,13 @@ class AuditWriter:
         if not batch:
             return
 
-        # Write to PostgreSQL
-        pg_ok = await self._write_pg(batch)
-
-        # Write to Blob Storage
-        blob_ok = await self._write_blob(batch)
+        # Write to PostgreSQL and Blob Storage concurrently — the sinks are
+        # independent and neither write raises, so a flush costs the slower
+        # of the two rather than their sum.
+        pg_ok, blob_ok = await asyncio.gather(
+            self._write_pg(batch),
+            self._write_blob(batch),
+        )
 
         # Fallback: if both sinks failed, log to stdout
         if not pg_ok and not blob_ok:
@@ -295,7 +308,7 @@ class AuditWriter:
                         pg["output_tokens"],
                         pg["status_code"],
                         pg["latency_ms"],
-                        json.dumps(pg["guardrails_result"]) if pg["guardrails_result"] else None,
+                        orjson.dumps(pg["guardrails_result"]).decode() if pg["guardrails_result"] else None,
                     ))
                 await conn.executemany(_INSERT_SQL, rows)
             return True
@@ -317,42 +330,68 @@ class AuditWriter:
         if self._blob_container_client is None:
             return False
 
-        written = 0
-        for record in batch:
-            try:
-                blob_dict = record.to_blob_dict()
-
-                # Apply PII redaction if configured (Issue #65)
-                if self._config.redact_pii:
-                    blob_dict = redact_blob_dict(blob_dict)
+        # Upload the batch concurrently — each blob is an independent PUT, so
+        # a batch costs roughly one round-trip instead of one per record.
+        # The semaphore keeps a large drain from opening hundreds of sockets.
+        semaphore = asyncio.Semaphore(_BLOB_UPLOAD_CONCURRENCY)
 
-                blob_json = json.dumps(blob_dict, default=str, ensure_ascii=False)
-                compressed = gzip.compress(blob_json.encode("utf-8"))
+        async def _bounded_upload(record: AuditRecord) -> bool:
+            async with semaphore:
+                return await self._upload_blob(record)
 
-                # Build blob path
-                ts = record.timestamp
-                customer = record.user_id or "anonymous"
-                blob_path = (
-                    f"{customer}/{ts.year}/{ts.month:02d}/{ts.day:02d}/"
-                    f"{ts.hour:02d}/{record.request_id}.json.gz"
-                )
-
-                blob_client = self._blob_container_client.get_blob_client(blob_path)
-                await blob_client.upload_blob(
-                    compressed,
-                    overwrite=False,
-                    content_settings={"content_type": "application/gzip"},
-                )
-                written += 1
-            except Exception:
-                logger.exception(
-                    "Failed to upload audit blob for %s", record.request_id,
-                )
+        results = await asyncio.gather(*(_bounded_upload(record) for record in batch))
+        written = sum(results)
 
         if written > 0:
             logger.debug("Audit blob batch: %d/%d records uploaded", written, len(batch))
         return written > 0
 
+    async def _upload_blob(self, record: AuditRecord) -> bool:
+        """Serialise, compress and upload a single audit record. Never raises."""
+        try:
+            # Redaction regexes + gzip over full request/response bodies are
+            # CPU-bound; run them on a worker thread (zlib releases the GIL)
+            # so a large batch doesn't stall the event loop serving traffic.
+            compressed = await asyncio.to_thread(self._encode_blob, record)
+
+            # Build blob path
+            ts = record.timestamp
+            customer = record.user_id or "anonymous"
+            blob_path = (
+                f"{customer}/{ts.year}/{ts.month:02d}/{ts.day:02d}/"
+                f"{ts.hour:02d}/{record.request_id}.json.gz"
+            )
+
+            blob_client = self._blob_container_client.get_blob_client(blob_path)
+            await blob_client.upload_blob(
+                compressed,
+                overwrite=False,
+                content_settings={"content_type": "application/gzip"},
+            )
+            return True
+        except Exception:
+            logger.exception(
+                "Failed to upload audit blob for %s", record.request_id,
+            )
+            return False
+
+    def _encode_blob(self, record: AuditRecord) -> bytes:
+        """Serialise one record to gzipped JSON, redacting PII if configured."""
+        blob_dict = record.to_blob_dict()
+
+        # Apply PII redaction if configured (Issue #65)
+        if self._config.redact_pii:
+            blob_dict = redact_blob_dict(blob_dict)
+
+        # orjson emits UTF-8 bytes directly — no str round-trip before gzip.
+        # It rejects integers beyond 64 bits, which raw request bodies can
+        # carry; fall back to stdlib json rather than lose the record.
+        try:
+            payload = orjson.dumps(blob_dict, default=str)
+        except TypeError:
+            payload = json.dumps(blob_dict, default=str).encode()
+        return gzip.compress(payload)
+
     def _log_fallback(self, record: AuditRecord) -> None:
         """Last-resort: log audit record to stdout as JSON.
 
@@ -12,6 +12,7 @@ to the legacy env-var check).
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 import time
@@ -85,6 +86,9 @@ class PostgresKeyStore:
     _pool: object = field(default=None, init=False, repr=False)
     _cache: dict[str, _CacheEntry] = field(default_factory=dict, init=False, repr=False)
     _spend_cache: dict[str, _SpendCacheEntry] = field(default_factory=dict, init=False, repr=False)
+    # Strong refs to in-flight background writes — the event loop only keeps
+    # weak refs, so an unreferenced task can be GC'd before it runs.
+    _background_tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)  # type: ignore[type-arg]
 
     @property
     def enabled(self) -> bool:
@@ -107,6 +111,8 @@ class PostgresKeyStore:
             self._pool = None
 
     async def shutdown(self) -> None:
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         if self._pool is not None:
             await self._pool.close()
             self._pool = None
@@ -163,16 +169,22 @@ class PostgresKeyStore:
         self._cache[key_hash] = _CacheEntry(value=info, expires_at=now + self.cache_ttl)
 
         # Update last_used_at (fire-and-forget, don't block the request)
+        task = asyncio.create_task(self._touch_last_used(row["id"]))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        return info
+
+    async def _touch_last_used(self, key_id: object) -> None:
+        """Stamp ``api_keys.last_used_at`` — best effort, never raises."""
         try:
             await self._pool.execute(
                 "UPDATE api_keys SET last_used_at = NOW() WHERE id = $1",
-                row["id"],
+                key_id,
             )
         except Exception:
             pass  # Non-critical — best effort
 
-        return info
-
     async def record_usage(
         self,
         *,
@@ -25,13 +25,21 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
 # ── Tiers that get metered ──────────────────────────────────────────
 _METERED_TIERS = frozenset({"pro", "managed"})
 
+# Max in-flight Stripe requests per flush.  Stripe has no batch endpoint,
+# so a flush is N independent POSTs; a small bound keeps us well under
+# Stripe's per-account rate limit while overlapping round-trips.
+_STRIPE_CONCURRENCY = 8
+
 
 # ── Meter event ─────────────────────────────────────────────────────
 
@@ -120,6 +128,7 @@ class StripeUsageReporter:
         self._secret_key = stripe_secret_key
         self._flush_interval = flush_interval
         self._task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
+        self._client: httpx.AsyncClient | None = None
         self._total_reported: int = 0
         self._total_dropped: int = 0
 
@@ -166,6 +175,9 @@ class StripeUsageReporter:
                 pass
         # Final drain on shutdown
         await self._flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         logger.info(
             "StripeUsageReporter stopped (reported=%d, dropped=%d, remaining=%d)",
             self._total_reported,
@@ -182,6 +194,26 @@ class StripeUsageReporter:
         except asyncio.CancelledError:
             pass
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared Stripe client, creating it on first use.
+
+        One client for the reporter's lifetime keeps the TLS connection to
+        api.stripe.com alive across flushes instead of re-handshaking every
+        ``flush_interval``.  Closed in ``stop()``.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url="https://api.stripe.com",
+                headers={
+                    "Authorization": f"Bearer {self._secret_key}",
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+                timeout=httpx.Timeout(10.0, connect=5.0),
+            )
+        return self._client
+
     async def _flush(self) -> None:
         """Drain the queue and send events to Stripe."""
         events: list[MeterEvent] = []
@@ -206,54 +238,14 @@ class StripeUsageReporter:
         # ── Send to Stripe Meter Events API ─────────────────────────
         # Stripe Meter Events API accepts one event per call (no batch
         # endpoint yet). We use httpx (already a dep) for async HTTP.
-        import httpx
-
-        async with httpx.AsyncClient(
-            base_url="https://api.stripe.com",
-            headers={
-                "Authorization": f"Bearer {self._secret_key}",
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
-            timeout=httpx.Timeout(10.0, connect=5.0),
-        ) as client:
-            for evt in events:
-                try:
-                    resp = await client.post(
-                        "/v1/billing/meter_events",
-                        data={
-                            "event_name": evt.event_name,
-                            "payload[stripe_customer_id]": evt.stripe_customer_id,
-                            "payload[value]": str(evt.value),
-                            "timestamp": str(evt.timestamp),
-                        },
-                        headers={
-                            "Idempotency-Key": evt.idempotency_key,
-                        },
-                    )
-                    if resp.status_code in (200, 201):
-                        self._total_reported += 1
-                    elif resp.status_code == 409:
-                        # Idempotent replay — already recorded
-                        self._total_reported += 1
-                        logger.debug(
-                            "Meter event already recorded (idempotent): %s",
-                            evt.idempotency_key,
-                        )
-                    else:
-                        self._total_dropped += 1
-                        logger.warning(
-                            "Stripe meter event failed (%d): %s — customer=%s value=%d",
-                            resp.status_code,
-                            resp.text[:200],
-                            evt.stripe_customer_id,
-                            evt.value,
-                        )
-                except Exception:
-                    self._total_dropped += 1
-                    logger.exception(
-                        "Failed to send meter event for customer=%s",
-                        evt.stripe_customer_id,
-                    )
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(_STRIPE_CONCURRENCY)
+
+        async def _bounded_send(evt: MeterEvent) -> None:
+            async with semaphore:
+                await self._send_event(client, evt)
+
+        await asyncio.gather(*(_bounded_send(evt) for evt in events))
 
         if events:
             logger.info(
@@ -261,3 +253,43 @@ class StripeUsageReporter:
                 len(events),
                 self._total_reported,
             )
+
+    async def _send_event(self, client: httpx.AsyncClient, evt: MeterEvent) -> None:
+        """POST one meter event and update counters.  Never raises."""
+        try:
+            resp = await client.post(
+                "/v1/billing/meter_events",
+                data={
+                    "event_name": evt.event_name,
+                    "payload[stripe_customer_id]": evt.stripe_customer_id,
+                    "payload[value]": str(evt.value),
+                    "timestamp": str(evt.timestamp),
+                },
+                headers={
+                    "Idempotency-Key": evt.idempotency_key,
+                },
+            )
+            if resp.status_code in (200, 201):
+                self._total_reported += 1
+            elif resp.status_code == 409:
+                # Idempotent replay — already recorded
+                self._total_reported += 1
+                logger.debug(
+                    "Meter event already recorded (idempotent): %s",
+                    evt.idempotency_key,
+                )
+            else:
+                self._total_dropped += 1
+                logger.warning(
+                    "Stripe meter event failed (%d): %s — customer=%s value=%d",
+                    resp.status_code,
+                    resp.text[:200],
+                    evt.stripe_customer_id,
+                    evt.value,
+                )
+        except Exception:
+            self._total_dropped += 1
+            logger.exception(
+                "Failed to send meter event for customer=%s",
+                evt.stripe_customer_id,
+            )
@@ -188,6 +188,14 @@ class Settings(BaseSettings):
         default=100,
         description="Max audit records per flush batch.",
     )
+    audit_blob_retry_total: int = Field(
+        default=3,
+        description="Retries for transient audit blob upload failures (timeouts, 5xx) before giving up.",
+    )
+    audit_blob_retry_backoff: float = Field(
+        default=1.0,
+        description="Initial backoff (seconds) for audit blob upload retries; grows exponentially.",
+    )
 
     # ── Tracing (OpenTelemetry) ──────────────────────────────────
     otel_enabled: bool = Field(
@@ -19,8 +19,9 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional
 
+import orjson
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response, StreamingResponse
@@ -40,6 +41,21 @@ _FILTERED_PATHS = frozenset({
 _MAX_BODY_READ_BYTES = 2_097_152  # 2 MB
 
 
+def _loads(data: bytes | str) -> Any:
+    """
+    Parse JSON with orjson, falling back to stdlib json.
+
+    orjson rejects ``NaN``/``Infinity`` and lone surrogate escapes, which
+    FastAPI's stdlib parser accepts — without the fallback such bodies
+    would skip screening.  Raises ``json.JSONDecodeError`` (orjson's error
+    subclasses it) if neither parser accepts the input.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
 class ContentSafetyMiddleware(BaseHTTPMiddleware):
     """
     Input/output content safety filtering middleware.
@@ -124,7 +140,7 @@ async def _extract_input_text(request: Request) -> str:
         body_bytes = await request.body()
         if len(body_bytes) > _MAX_BODY_READ_BYTES:
             return ""
-        body = json.loads(body_bytes)
+        body = _loads(body_bytes)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return ""
 
@@ -265,7 +281,7 @@ def _wrap_streaming_output(
             for line in chunk_str.split("\n"):
                 if line.startswith("data: ") and line.strip() != "data: [DONE]":
                     try:
-                        data = json.loads(line[6:])
+                        data = _loads(line[6:])
                         delta = (
                             data.get("choices", [{}])[0]
                             .get("delta", {})
@@ -291,14 +307,14 @@ def _wrap_streaming_output(
                         len(accumulated_text),
                     )
                     # Yield a content_filter finish event
-                    filter_event = json.dumps({
+                    filter_event = orjson.dumps({
                         "choices": [{
                             "index": 0,
                             "delta": {"content": "\n\n[Content filtered by safety policy]"},
                             "finish_reason": "content_filter",
                         }]
                     })
-                    yield f"data: {filter_event}\n\n".encode("utf-8")
+                    yield b"data: " + filter_event + b"\n\n"
                     yield b"data: [DONE]\n\n"
                     break
 
@@ -326,7 +342,7 @@ def _wrap_streaming_output(
 def _extract_output_text(body_text: str) -> str:
     """Extract assistant message text from a non-streaming response body."""
     try:
-        data = json.loads(body_text)
+        data = _loads(body_text)
         choices = data.get("choices", [])
         if not choices:
             return ""
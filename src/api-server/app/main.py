@@ -110,6 +110,8 @@ async def lifespan(app: FastAPI):
         queue_size=settings.audit_queue_size,
         flush_interval=settings.audit_flush_interval,
         batch_size=settings.audit_batch_size,
+        blob_retry_total=settings.audit_blob_retry_total,
+        blob_retry_backoff=settings.audit_blob_retry_backoff,
     )
     audit_writer = AuditWriter(
         config=audit_config,
@@ -18,7 +18,9 @@ Strategies:
 from __future__ import annotations
 
 import fnmatch
+import functools
 import logging
+import operator
 import random
 import re
 import time
@@ -75,6 +77,15 @@ class RoutingEngine:
     def __init__(self, route_repo, model_registry=None) -> None:
         self._repo = route_repo
         self._registry = model_registry
+        # Strategy → evaluator, built once instead of an if/elif chain per request.
+        self._evaluators = {
+            RoutingStrategy.DIRECT: self._eval_direct,
+            RoutingStrategy.COMPLEXITY: self._eval_complexity,
+            RoutingStrategy.COST: self._eval_cost,
+            RoutingStrategy.LATENCY: self._eval_latency,
+            RoutingStrategy.RANDOM: self._eval_random,
+            RoutingStrategy.FALLBACK: self._eval_fallback,
+        }
 
     def resolve(self, ctx: InferenceContext) -> RoutingDecision:
         """
@@ -135,10 +146,7 @@ class RoutingEngine:
 
         # Model match (glob patterns)
         if m.models != ["*"]:
-            if not any(
-                fnmatch.fnmatch(ctx.model_requested, pattern)
-                for pattern in m.models
-            ):
+            if not m.models or not _compile_model_globs(tuple(m.models)).match(ctx.model_requested):
                 return False
 
         # Header match (all required headers must be present)
@@ -152,23 +160,11 @@ class RoutingEngine:
         self, route: RouteConfig, ctx: InferenceContext
     ) -> RoutingDecision:
         """Apply the route's strategy to produce a routing decision."""
-        strategy = route.strategy
-
-        if strategy == RoutingStrategy.DIRECT:
-            return self._eval_direct(route, ctx)
-        elif strategy == RoutingStrategy.COMPLEXITY:
-            return self._eval_complexity(route, ctx)
-        elif strategy == RoutingStrategy.COST:
-            return self._eval_cost(route, ctx)
-        elif strategy == RoutingStrategy.LATENCY:
-            return self._eval_latency(route, ctx)
-        elif strategy == RoutingStrategy.RANDOM:
-            return self._eval_random(route, ctx)
-        elif strategy == RoutingStrategy.FALLBACK:
-            return self._eval_fallback(route, ctx)
-        else:
-            logger.warning("Unknown strategy '%s' on route %s — using direct", strategy, route.route_id)
-            return self._eval_direct(route, ctx)
+        evaluator = self._evaluators.get(route.strategy)
+        if evaluator is None:
+            logger.warning("Unknown strategy '%s' on route %s — using direct", route.strategy, route.route_id)
+            evaluator = self._eval_direct
+        return evaluator(route, ctx)
 
     def _eval_direct(self, route: RouteConfig, ctx: InferenceContext) -> RoutingDecision:
         """Direct routing: use the first rule's target or the requested model."""
@@ -285,6 +281,21 @@ class RoutingEngine:
         )
 
 
+# ── Model glob matching ─────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_model_globs(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile a route's model glob list into a single regex.
+
+    One alternation is matched in a single pass, instead of trying each
+    pattern with ``fnmatch`` in turn for every candidate route.  Cached per
+    pattern tuple, so each route's list is translated once.
+    """
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
 # ── Condition evaluator ─────────────────────────────────────────────
 
 # Simple safe expression evaluator for conditions like:
@@ -297,13 +308,24 @@ _CONDITION_RE = re.compile(
     r"^(token_count|message_count)\s*(==|!=|<|<=|>|>=)\s*(\d+)$"
 )
 
+_COMPARATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
 
-def _evaluate_condition(condition: str, ctx: InferenceContext) -> bool:
+
+@functools.lru_cache(maxsize=1024)
+def _parse_condition(condition: str):
     """
-    Safely evaluate a routing condition against request context.
+    Parse a condition string once into a constant or a comparison tuple.
 
-    Only supports simple comparisons on ``token_count`` and ``message_count``.
-    Returns True for unrecognized conditions (fail-open).
+    Returns ``True``/``False`` for constant conditions, otherwise
+    ``(var_name, comparator, threshold)``.  Route rules are evaluated on
+    every request but change rarely, so parsing is cached per string.
     """
     condition = condition.strip()
 
@@ -318,8 +340,21 @@ def _evaluate_condition(condition: str, ctx: InferenceContext) -> bool:
         return True
 
     var_name, op, threshold_str = match.groups()
-    threshold = int(threshold_str)
+    return var_name, _COMPARATORS[op], int(threshold_str)
+
+
+def _evaluate_condition(condition: str, ctx: InferenceContext) -> bool:
+    """
+    Safely evaluate a routing condition against request context.
+
+    Only supports simple comparisons on ``token_count`` and ``message_count``.
+    Returns True for unrecognized conditions (fail-open).
+    """
+    parsed = _parse_condition(condition)
+    if isinstance(parsed, bool):
+        return parsed
 
+    var_name, compare, threshold = parsed
     if var_name == "token_count":
         value = ctx.token_count_estimate
     elif var_name == "message_count":
@@ -327,17 +362,4 @@ def _evaluate_condition(condition: str, ctx: InferenceContext) -> bool:
     else:
         return True
 
-    if op == "==":
-        return value == threshold
-    elif op == "!=":
-        return value != threshold
-    elif op == "<":
-        return value < threshold
-    elif op == "<=":
-        return value <= threshold
-    elif op == ">":
-        return value > threshold
-    elif op == ">=":
-        return value >= threshold
-
-    return True
+    return compare(value, threshold)
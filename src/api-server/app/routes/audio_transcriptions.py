@@ -7,6 +7,7 @@ Proxies the upload to the Whisper TensorRT-LLM backend.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import httpx
@@ -14,6 +15,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Uplo
 
 from app.auth import require_api_key
 from app.billing import emit_usage_event
+from app.config import get_settings
 from app.metrics import track_request
 from app.routing.backend_client import CircuitOpenError
 from app.schemas.audio import TranscriptionResponse
@@ -110,7 +112,6 @@ async def create_transcription(
             # Store as "output_tokens" = seconds * 100 (centiseconds for precision)
             key_store = getattr(request.app.state, "key_store", None)
             if key_store is not None:
-                import asyncio
                 asyncio.ensure_future(key_store.record_usage(
                     user_id=key_info.user_id,
                     api_key_id=key_info.key_id,
@@ -123,8 +124,7 @@ async def create_transcription(
             # Stripe metering — centiseconds of audio
             centiseconds = int(audio_seconds * 100)
             if centiseconds > 0:
-                from app.config import get_settings as _get_settings
-                _s = _get_settings()
+                _s = get_settings()
                 emit_usage_event(
                     tier=key_info.tier,
                     stripe_customer_id=key_info.stripe_customer_id,
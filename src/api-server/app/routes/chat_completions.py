@@ -7,16 +7,18 @@ Proxies the request to the appropriate TensorRT-LLM backend.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import time
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from app.auth import require_api_key
 from app.billing import emit_usage_event
+from app.config import get_settings
 from app.metrics import INFLIGHT_REQUESTS, REQUEST_DURATION, REQUESTS_TOTAL, track_request
 from app.middleware.rate_limit import record_tokens
 from app.routing.backend_client import CircuitOpenError
@@ -94,18 +96,18 @@ async def create_chat_completion(
                     for line in chunk_str.split("\n"):
                         if line.startswith("data: ") and line.strip() != "data: [DONE]":
                             try:
-                                chunk_data = json.loads(line[6:])
+                                chunk_data = orjson.loads(line[6:])
                                 for choice in chunk_data.get("choices", []):
                                     if choice.get("delta", {}).get("content"):
                                         completion_tokens += 1  # Approximate: 1 chunk ≈ 1 token
-                            except (json.JSONDecodeError, KeyError):
+                            except (orjson.JSONDecodeError, KeyError):
                                 pass
                     yield chunk
             except Exception:
                 status = "error"
                 logger.exception("Stream error from backend for model '%s'", body.model)
-                error_payload = json.dumps({"error": {"message": "Backend stream failed", "type": "server_error"}})
-                yield f"data: {error_payload}\n\n".encode()
+                error_payload = orjson.dumps({"error": {"message": "Backend stream failed", "type": "server_error"}})
+                yield b"data: " + error_payload + b"\n\n"
                 yield b"data: [DONE]\n\n"
             finally:
                 duration = time.monotonic() - t_start
@@ -119,7 +121,6 @@ async def create_chat_completion(
                     record_tokens(request, completion_tokens)
                     key_store = getattr(request.app.state, "key_store", None)
                     if key_store is not None:
-                        import asyncio
                         asyncio.ensure_future(key_store.record_usage(
                             user_id=key_info.user_id,
                             api_key_id=key_info.key_id,
@@ -132,7 +133,6 @@ async def create_chat_completion(
                     # Stripe metering — output tokens only (input unknown for streaming)
                     settings = request.app.state._settings if hasattr(request.app.state, '_settings') else None
                     if settings is None:
-                        from app.config import get_settings
                         settings = get_settings()
                     if completion_tokens > 0:
                         emit_usage_event(
@@ -167,7 +167,6 @@ async def create_chat_completion(
             record_tokens(request, total_tokens)
             key_store = getattr(request.app.state, "key_store", None)
             if key_store is not None:
-                import asyncio
                 asyncio.ensure_future(key_store.record_usage(
                     user_id=key_info.user_id,
                     api_key_id=key_info.key_id,
@@ -178,8 +177,7 @@ async def create_chat_completion(
                     request_id=request_id or None,
                 ))
             # Stripe metering — separate events for input and output tokens
-            from app.config import get_settings as _get_settings
-            _s = _get_settings()
+            _s = get_settings()
             prompt_tok = usage.get("prompt_tokens", 0)
             completion_tok = usage.get("completion_tokens", 0)
             if prompt_tok > 0:
@@ -6,6 +6,7 @@ Proxies the request to the ONNX Runtime embedding backend.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import httpx
@@ -13,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.auth import require_api_key
 from app.billing import emit_usage_event
+from app.config import get_settings
 from app.metrics import track_request
 from app.middleware.rate_limit import record_tokens
 from app.routing.backend_client import CircuitOpenError
@@ -88,7 +90,6 @@ async def create_embedding(
             record_tokens(request, total_tokens)
             key_store = getattr(request.app.state, "key_store", None)
             if key_store is not None:
-                import asyncio
                 asyncio.ensure_future(key_store.record_usage(
                     user_id=key_info.user_id,
                     api_key_id=key_info.key_id,
@@ -100,8 +101,7 @@ async def create_embedding(
                 ))
             # Stripe metering — embedding tokens
             if total_tokens > 0:
-                from app.config import get_settings as _get_settings
-                _s = _get_settings()
+                _s = get_settings()
                 queued = emit_usage_event(
                     tier=key_info.tier,
                     stripe_customer_id=key_info.stripe_customer_id,
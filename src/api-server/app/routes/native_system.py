@@ -8,7 +8,7 @@ GET /api/v1/gpu-pools   GPU pool capacity summary
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from fastapi import APIRouter, Depends, Request
 
@@ -89,10 +89,9 @@ async def gpu_pools(
     # Static models from YAML registry — we only know sku from ModelSpec
     # indirectly via the model deployment YAMLs. Pull from native repo.
     registered_models = await repo.list_models()
-    for m in registered_models:
-        sku = m["required_gpu_sku"]
+    for sku, count in Counter(m["required_gpu_sku"] for m in registered_models).items():
         pools[sku]["gpu_sku"] = sku
-        pools[sku]["models_registered"] += 1
+        pools[sku]["models_registered"] = count
 
     # 2. Walk deployments to count running + GPU allocation.
     all_deployments = await repo.list_deployments()
@@ -13,12 +13,14 @@ This module handles:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
 from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 from opentelemetry.propagate import inject
 
 from app.config import get_settings
@@ -31,6 +33,27 @@ _MAX_RETRIES = 2
 _RETRY_BACKOFF_BASE = 0.5  # seconds — exponential: 0.5, 1.0
 
 
+def _json_headers(headers: dict[str, str] | None) -> dict[str, str]:
+    """Copy *headers* and mark the body as JSON (we pass pre-encoded bytes)."""
+    merged = dict(headers or {})
+    merged.setdefault("Content-Type", "application/json")
+    return merged
+
+
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    """
+    Serialise *payload* for the backend request body.
+
+    orjson rejects integers beyond 64 bits, which schema validation lets
+    through (e.g. ``max_tokens``).  Fall back to stdlib json so such
+    requests are still forwarded and the backend's own 4xx reaches the client.
+    """
+    try:
+        return orjson.dumps(payload)
+    except TypeError:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+
 class CircuitOpenError(Exception):
     """Raised when the circuit breaker for a backend is open."""
 
@@ -147,14 +170,16 @@ class BackendClient:
         if cb.is_open:
             raise CircuitOpenError(url, cb.reset_at)
 
-        headers = dict(headers or {})
+        headers = _json_headers(headers)
         inject(headers)  # W3C traceparent propagation
+        # Encoded once — retries resend the same bytes.
+        content = _encode_json(payload)
 
         last_exc: Exception | None = None
         for attempt in range(_MAX_RETRIES + 1):
             try:
                 response = await self._client.post(
-                    url, json=payload, headers=headers
+                    url, content=content, headers=headers
                 )
                 if response.status_code in _RETRYABLE_STATUS and attempt < _MAX_RETRIES:
                     logger.warning(
@@ -205,14 +230,14 @@ class BackendClient:
         if cb.is_open:
             raise CircuitOpenError(url, cb.reset_at)
 
-        headers = dict(headers or {})
+        headers = _json_headers(headers)
         inject(headers)  # W3C traceparent propagation
 
         try:
             async with self._client.stream(
                 "POST",
                 url,
-                json=payload,
+                content=_encode_json(payload),
                 headers=headers,
             ) as response:
                 response.raise_for_status()
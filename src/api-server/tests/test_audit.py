@@ -397,6 +397,12 @@ class TestAuditHelpers:
         assert _extract_modality("/v1/models") is None
         assert _extract_modality("/api/v1/routes") is None
 
+    def test_extract_modality_ignores_keyword_substrings(self):
+        from app.audit.middleware import _extract_modality
+        assert _extract_modality("/v1/embeddings/") == "embedding"
+        assert _extract_modality("/api/v1/models/bge-embeddings") is None
+        assert _extract_modality("/api/v1/deployments/chat/completions") is None
+
     def test_hash_ip(self):
         from app.audit.middleware import _hash_ip
         h1 = _hash_ip("192.168.1.1")
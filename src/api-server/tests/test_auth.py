@@ -102,3 +102,47 @@ class TestAuthEnabled:
             )
             # Empty bearer token should fail
             assert resp.status_code == 401
+
+
+class TestKeyStoreLastUsed:
+    """last_used_at is stamped in the background, off the request path."""
+
+    @pytest.mark.asyncio
+    async def test_validate_does_not_wait_for_last_used_update(self, monkeypatch):
+        import asyncio
+
+        from app.auth import key_store as key_store_module
+        from app.auth.key_store import PostgresKeyStore
+
+        monkeypatch.setattr(key_store_module, "asyncpg", object())
+        release = asyncio.Event()
+        updated: list[object] = []
+
+        class _FakePool:
+            async def fetchrow(self, query, key_hash):
+                return {
+                    "id": "key-1",
+                    "user_id": "user-1",
+                    "name": "test",
+                    "revoked_at": None,
+                    "tier": "pro",
+                    "stripe_customer_id": "",
+                }
+
+            async def execute(self, query, key_id):
+                await release.wait()
+                updated.append(key_id)
+
+            async def close(self):
+                pass
+
+        store = PostgresKeyStore(database_url="postgresql://fake")
+        store._pool = _FakePool()
+
+        info = await asyncio.wait_for(store.validate("dai_sk_test"), timeout=1.0)
+        assert info is not None
+        assert updated == []
+
+        release.set()
+        await store.shutdown()
+        assert updated == ["key-1"]
@@ -394,6 +394,79 @@ class TestStripeUsageReporter:
         assert reporter.stats["total_reported"] == 1
         assert reporter.stats["total_dropped"] == 0
 
+    @pytest.mark.asyncio
+    async def test_client_reused_across_flushes_and_closed_on_stop(self):
+        """One httpx client serves every flush; stop() closes it."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.billing import StripeUsageReporter, emit_usage_event
+
+        reporter = StripeUsageReporter(
+            stripe_secret_key="sk_test_secret",
+            flush_interval=999,
+        )
+        client = reporter._get_client()  # noqa: SLF001
+        post = AsyncMock(return_value=MagicMock(status_code=200))
+
+        with patch.object(client, "post", post):
+            for i in range(2):
+                emit_usage_event(
+                    tier="pro",
+                    stripe_customer_id="cus_reuse",
+                    event_name="chat_input_tokens",
+                    value=10,
+                    idempotency_key=f"reuse-{i}",
+                )
+                await reporter._flush()  # noqa: SLF001
+
+        # Both flushes went through the same client instance
+        assert post.await_count == 2
+        assert reporter._client is client  # noqa: SLF001
+        assert reporter.stats["total_reported"] == 2
+
+        await reporter.stop()
+        assert client.is_closed
+        assert reporter._client is None  # noqa: SLF001
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_events_concurrently(self):
+        """Per-event POSTs overlap, bounded by _STRIPE_CONCURRENCY."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from app import billing
+        from app.billing import StripeUsageReporter, emit_usage_event
+
+        in_flight = 0
+        peak = 0
+
+        async def _post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(status_code=200)
+
+        for i in range(billing._STRIPE_CONCURRENCY * 2):  # noqa: SLF001
+            emit_usage_event(
+                tier="pro",
+                stripe_customer_id="cus_fanout",
+                event_name="chat_output_tokens",
+                value=i + 1,
+                idempotency_key=f"fanout-{i}",
+            )
+
+        reporter = StripeUsageReporter(
+            stripe_secret_key="sk_test_secret",
+            flush_interval=999,
+        )
+        reporter._client = MagicMock(post=_post)  # noqa: SLF001
+        await reporter._flush()  # noqa: SLF001
+
+        assert reporter.stats["total_reported"] == billing._STRIPE_CONCURRENCY * 2  # noqa: SLF001
+        assert peak == billing._STRIPE_CONCURRENCY  # noqa: SLF001
+
 
 # ── KeyInfo stripe_customer_id ──────────────────────────────────────
 
@@ -283,6 +283,16 @@ class TestBlobWriter:
             except asyncio.CancelledError:
                 pass
 
+    def test_blob_encodes_ints_beyond_64_bits(self):
+        """Bodies orjson can't encode fall back to stdlib json, not a lost record."""
+        writer = AuditWriter(AuditConfig(enabled=True, blob_enabled=True))
+        record = _make_record(request_body={"model": "m", "max_tokens": 10**20})
+
+        data = json.loads(gzip.decompress(writer._encode_blob(record)))
+
+        assert data["request_body"]["max_tokens"] == 10**20
+        assert data["request_id"] == "req-blob-test"
+
     @pytest.mark.asyncio
     async def test_blob_redaction_enabled(self):
         """When redact_pii=True, uploaded blob should have PII scrubbed."""
@@ -426,6 +436,38 @@ class TestBlobWriter:
             except asyncio.CancelledError:
                 pass
 
+    @pytest.mark.asyncio
+    async def test_blob_uploads_run_concurrently(self):
+        """A batch's uploads overlap instead of running one after another."""
+        config = AuditConfig(
+            enabled=True,
+            pg_enabled=False,
+            blob_enabled=True,
+            storage_connection_string="DefaultEndpointsProtocol=https;AccountName=test;AccountKey=fake;EndpointSuffix=core.windows.net",
+            flush_interval=60.0,
+            batch_size=10,
+        )
+        mock_service, mock_container, mock_blob = _mock_blob_service()
+        in_flight = 0
+        peak = 0
+
+        async def slow_upload(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+        mock_blob.upload_blob = AsyncMock(side_effect=slow_upload)
+
+        writer = AuditWriter(config)
+        writer._blob_container_client = mock_container
+        batch = [_make_record(request_id=f"req-{i}") for i in range(5)]
+
+        assert await writer._write_blob(batch) is True
+        assert mock_blob.upload_blob.call_count == 5
+        assert peak == 5
+
     @pytest.mark.asyncio
     async def test_blob_path_anonymous_user(self):
         """Records without user_id use 'anonymous' in blob path."""
@@ -511,3 +553,28 @@ class TestBlobWriter:
         # Record still processed (blob write returns False, fallback fires)
         assert writer.records_written == 1
         await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_blob_client_configured_with_retry_policy(self):
+        """Transient upload failures are retried by the SDK with a short backoff."""
+        config = AuditConfig(
+            enabled=True,
+            pg_enabled=False,
+            blob_enabled=True,
+            storage_connection_string="DefaultEndpointsProtocol=https;AccountName=test;AccountKey=fake;EndpointSuffix=core.windows.net",
+            blob_retry_total=5,
+            blob_retry_backoff=0.5,
+        )
+        writer = AuditWriter(config)
+
+        mock_service, mock_container, _ = _mock_blob_service()
+        mock_bsc = MagicMock()
+        mock_bsc.from_connection_string.return_value = mock_service
+        with patch.dict("sys.modules", {"azure.storage.blob.aio": MagicMock(BlobServiceClient=mock_bsc)}):
+            await writer.start()
+
+        kwargs = mock_bsc.from_connection_string.call_args.kwargs
+        assert kwargs["retry_total"] == 5
+        assert kwargs["initial_backoff"] == 0.5
+        assert writer._blob_container_client is mock_container
+        await writer.stop()
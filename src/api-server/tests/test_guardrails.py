@@ -459,6 +459,19 @@ class TestInputBlocking:
         assert body["error"]["categories"]["Hate"]["severity"] == 6
         assert body["error"]["categories"]["Hate"]["filtered"] is True
 
+    def test_chat_blocked_with_nan_in_body(self, blocking_client):
+        """Bodies orjson rejects (NaN literal) must still be screened."""
+        resp = blocking_client.post(
+            "/v1/chat/completions",
+            content=(
+                b'{"model": "test-chat-model", "x": NaN,'
+                b' "messages": [{"role": "user", "content": "hateful content"}]}'
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+        assert resp.status_code == 400
+        assert resp.json()["error"]["code"] == "content_filtered"
+
     def test_embeddings_blocked(self, blocking_client):
         """Embedding request with hateful content should be blocked."""
         resp = blocking_client.post(
@@ -359,6 +359,19 @@ class TestChatProxy:
         # Histogram should have at least one observation
         assert 'directai_request_duration_seconds_count{method="chat",model="mock-chat"}' in body
 
+    def test_int_beyond_64_bits_still_forwarded(self, proxy_client: TestClient):
+        """Payloads orjson can't encode fall back to stdlib json, not a 502."""
+        resp = proxy_client.post(
+            "/v1/chat/completions",
+            json={
+                "model": "mock-chat",
+                "messages": [{"role": "user", "content": "Hi"}],
+                "max_tokens": 10**20,
+            },
+        )
+        assert resp.status_code == 200
+        assert _received_requests[-1]["body"]["max_tokens"] == 10**20
+
     def test_alias_resolution(self, proxy_client: TestClient):
         """Both aliases route to the same backend."""
         resp = proxy_client.post(
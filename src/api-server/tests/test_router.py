@@ -24,7 +24,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi.testclient import TestClient
 
-from app.router.engine import RoutingEngine, _evaluate_condition
+from app.router.engine import RoutingEngine, _compile_model_globs, _evaluate_condition
 from app.router.fallback import (
     AllModelsFailedError,
     CircuitBreaker,
@@ -121,6 +121,25 @@ class TestConditionEvaluator:
         """Unrecognized conditions fail-open (return True)."""
         assert _evaluate_condition("unknown_var > 5", self._ctx()) is True
 
+    def test_parsed_condition_reused_across_contexts(self):
+        """A cached parse must still compare against each request's values."""
+        assert _evaluate_condition("  token_count < 100 ", self._ctx(tokens=10)) is True
+        assert _evaluate_condition("  token_count < 100 ", self._ctx(tokens=500)) is False
+
+
+class TestModelGlobs:
+    def test_matches_any_pattern(self):
+        globs = _compile_model_globs(("qwen*", "llama-3.?-8b"))
+        assert globs.match("qwen2.5-3b")
+        assert globs.match("llama-3.1-8b")
+        assert not globs.match("mistral-7b")
+
+    def test_anchored_like_fnmatch(self):
+        globs = _compile_model_globs(("qwen",))
+        assert globs.match("qwen")
+        assert not globs.match("qwen2.5-3b")
+        assert not globs.match("my-qwen")
+
 
 # ════════════════════════════════════════════════════════════════════
 # RouteRepository unit tests
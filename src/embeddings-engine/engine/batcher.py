@@ -11,7 +11,7 @@ Design:
   - A background loop drains the queue every `batch_timeout_ms` or when
     `max_batch_size` items are queued, whichever comes first.
   - Each batch runs a single model.embed() call.
-  - Results are scattered back to individual Futures.
+  - Results (embedding + token count) are scattered back to individual Futures.
 """
 
 from __future__ import annotations
@@ -44,7 +44,7 @@ class DynamicBatcher:
     Usage:
         batcher = DynamicBatcher(model, max_batch_size=256, batch_timeout_ms=5.0)
         await batcher.start()
-        embedding = await batcher.submit("Hello world")  # 1-D numpy array
+        embedding, n_tokens = await batcher.submit("Hello world")
         await batcher.stop()
     """
 
@@ -89,20 +89,21 @@ class DynamicBatcher:
         await self._drain_batch()
         logger.info("Dynamic batcher stopped. Processed %d batches, %d items.", self.batches_processed, self.items_processed)
 
-    async def submit(self, text: str) -> np.ndarray:
+    async def submit(self, text: str) -> tuple[np.ndarray, int]:
         """
         Submit a single text for embedding. Returns when the batch
         containing this text has been processed.
 
         Returns:
-            1-D numpy array of shape [embedding_dim].
+            ``(embedding, token_count)`` — a 1-D numpy array of shape
+            [embedding_dim] and the text's token count.
         """
         loop = asyncio.get_running_loop()
         future = loop.create_future()
         await self._queue.put(_PendingRequest(text=text, future=future))
         return await future
 
-    async def submit_batch(self, texts: list[str]) -> list[np.ndarray]:
+    async def submit_batch(self, texts: list[str]) -> list[tuple[np.ndarray, int]]:
         """
         Submit multiple texts. All may land in the same batch or be
         split across batches. Returns in input order.
@@ -180,7 +181,7 @@ class DynamicBatcher:
         try:
             # Run in executor to avoid blocking the event loop
             loop = asyncio.get_running_loop()
-            embeddings = await loop.run_in_executor(None, self._model.embed, texts)
+            embeddings, token_counts = await loop.run_in_executor(None, self._model.embed, texts)
 
             elapsed_ms = (time.monotonic() - t0) * 1000
             self.batches_processed += 1
@@ -196,7 +197,7 @@ class DynamicBatcher:
             # Scatter results
             for i, req in enumerate(batch):
                 if not req.future.done():
-                    req.future.set_result(embeddings[i])
+                    req.future.set_result((embeddings[i], int(token_counts[i])))
 
         except Exception as exc:
             logger.exception("Batch inference failed for %d items", len(batch))
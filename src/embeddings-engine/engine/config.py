@@ -29,10 +29,18 @@ class Settings(BaseSettings):
     # ── Batching ────────────────────────────────────────────────────
     max_batch_size: int = 256
     batch_timeout_ms: float = 5.0  # Max wait to fill a batch (ms)
+    # Startup warmup shape — a typical batch, not the worst case, so pods
+    # don't pin worst-case arena memory they may never need (0 = disabled).
+    warmup_batch_size: int = 8
+    warmup_seq_length: int = 128
 
     # ── Runtime ─────────────────────────────────────────────────────
-    num_threads: int = 4  # ONNX Runtime intra-op threads
+    num_threads: int = 4  # ONNX Runtime intra-op threads (0 = one per physical core)
     execution_provider: str = "CUDAExecutionProvider"  # or CPUExecutionProvider
+    # Serve the INT8 variant (model_int8.onnx next to model_path) produced by
+    # `engine.export --int8`.  Meant for CPU deploys; falls back to model_path
+    # if the quantized file is missing.
+    quantized: bool = False
 
     # ── Normalization ───────────────────────────────────────────────
     normalize_embeddings: bool = True
@@ -8,6 +8,7 @@ This produces:
     /models/model.onnx         — ONNX model (optimized, FP16 for GPU)
     /models/tokenizer.json     — HuggingFace fast tokenizer
     /models/config.json        — Model config for reference
+    /models/model_int8.onnx    — INT8 dynamically quantized model (--int8, CPU deploys)
 
 Requirements (not in main deps — build-time only):
     pip install optimum[onnxruntime-gpu] transformers torch
@@ -23,7 +24,14 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
-def export_model(model_id: str, output_dir: str, *, opset: int = 17, fp16: bool = True) -> None:
+def export_model(
+    model_id: str,
+    output_dir: str,
+    *,
+    opset: int = 17,
+    fp16: bool = True,
+    int8: bool = False,
+) -> None:
     """Export a HuggingFace transformer model to ONNX."""
     from optimum.onnxruntime import ORTModelForFeatureExtraction
     from transformers import AutoTokenizer
@@ -74,19 +82,53 @@ def export_model(model_id: str, output_dir: str, *, opset: int = 17, fp16: bool
         except Exception:
             logger.warning("FP16 conversion failed — using FP32 model", exc_info=True)
 
+    # Optional INT8 variant — quantized from the FP32 graph, never the FP16 one
+    if int8:
+        fp32_path = out / "model_fp32.onnx"
+        if not fp32_path.exists():
+            fp32_path = out / "model.onnx"
+        quantize_int8(fp32_path, out / "model_int8.onnx")
+
     logger.info("Export complete: %s", out)
 
 
+def quantize_int8(model_path: Path, output_path: Path) -> None:
+    """
+    Dynamically quantize an FP32 ONNX model to INT8 weights.
+
+    Activations are quantized at runtime, so no calibration data is needed.
+    Serve the result with ``EMBED_QUANTIZED=true`` on CPU nodes — it cuts
+    model size ~4x and memory bandwidth per batch accordingly.
+
+    Settings matter here: QUInt8 weights, quantizing every op type, or
+    per-tensor scales routinely make dynamic INT8 *slower* than FP32.  Only
+    MatMul is quantized (that is where the FLOPs are), with signed per-channel
+    weights, which map onto the VNNI dot-product instructions.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logger.info("Quantizing %s to INT8 → %s", model_path, output_path)
+    quantize_dynamic(
+        model_input=str(model_path),
+        model_output=str(output_path),
+        op_types_to_quantize=["MatMul"],
+        per_channel=True,
+        weight_type=QuantType.QInt8,
+    )
+    logger.info("INT8 model saved to %s", output_path)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Export HuggingFace model to ONNX")
     parser.add_argument("--model-id", required=True, help="HuggingFace model ID (e.g., BAAI/bge-large-en-v1.5)")
     parser.add_argument("--output-dir", required=True, help="Output directory for ONNX model and tokenizer")
     parser.add_argument("--opset", type=int, default=17, help="ONNX opset version")
     parser.add_argument("--no-fp16", action="store_true", help="Skip FP16 conversion")
+    parser.add_argument("--int8", action="store_true", help="Also write an INT8 quantized model (CPU deploys)")
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-    export_model(args.model_id, args.output_dir, opset=args.opset, fp16=not args.no_fp16)
+    export_model(args.model_id, args.output_dir, opset=args.opset, fp16=not args.no_fp16, int8=args.int8)
 
 
 if __name__ == "__main__":
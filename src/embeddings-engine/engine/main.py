@@ -15,6 +15,7 @@ import logging
 import time
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel, Field
 from starlette.responses import Response
@@ -56,8 +57,11 @@ async def lifespan(app: FastAPI):
         normalize=settings.normalize_embeddings,
         execution_provider=settings.execution_provider,
         num_threads=settings.num_threads,
+        quantized=settings.quantized,
     )
     model.load()
+    if settings.warmup_batch_size > 0:
+        model.warmup(settings.warmup_batch_size, settings.warmup_seq_length)
     app.state.model = model
 
     # Start batcher
@@ -149,29 +153,35 @@ async def create_embedding(body: EmbeddingRequest, request: Request):
 
         BATCH_SIZE.observe(len(texts))
 
-        # Submit to dynamic batcher
-        embeddings = await batcher.submit_batch(texts)
-
-        # Token count from actual tokenizer (via model's tokenize method)
-        model: EmbeddingModel = request.app.state.model
-        total_tokens = sum(model.count_tokens(t) for t in texts)
+        # Submit to dynamic batcher — token counts come back from the same
+        # tokenization used for inference, so texts are not re-tokenized here.
+        results = await batcher.submit_batch(texts)
+        embeddings = [emb for emb, _ in results]
+        total_tokens = sum(n_tokens for _, n_tokens in results)
         TOKENS_TOTAL.inc(total_tokens)
 
-        # Build response
-        data = [
-            EmbeddingData(index=i, embedding=emb.tolist())
-            for i, emb in enumerate(embeddings)
-        ]
+        # Build response.  Serialised straight from the float32 arrays with
+        # orjson — going through emb.tolist() and pydantic would box every
+        # component as a Python float (dim × batch objects per request).
+        # The body matches EmbeddingResponse, which still documents the schema.
+        body_bytes = orjson.dumps(
+            {
+                "object": "list",
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": emb}
+                    for i, emb in enumerate(embeddings)
+                ],
+                "model": model_name,
+                "usage": {"prompt_tokens": total_tokens, "total_tokens": total_tokens},
+            },
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
 
         duration = time.monotonic() - t0
         REQUEST_DURATION.observe(duration)
         REQUESTS_TOTAL.labels(status="ok").inc()
 
-        return EmbeddingResponse(
-            data=data,
-            model=model_name,
-            usage=EmbeddingUsage(prompt_tokens=total_tokens, total_tokens=total_tokens),
-        )
+        return Response(content=body_bytes, media_type="application/json")
 
     except HTTPException:
         REQUESTS_TOTAL.labels(status="error").inc()
@@ -203,7 +213,7 @@ async def readyz(request: Request):
         raise HTTPException(status_code=503, detail="Model not loaded.")
     if not batcher.is_healthy:
         raise HTTPException(status_code=503, detail="Batcher loop not running.")
-    return {"status": "ready", "model": request.app.state.model_name}
+    return {"status": "ready", "model": request.app.state.model_name, "variant": model.variant}
 
 
 @app.get("/metrics")
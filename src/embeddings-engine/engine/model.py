@@ -7,6 +7,7 @@ Handles:
   - Batch inference with proper attention masking
   - L2 normalization (optional)
   - Mean pooling over token embeddings
+  - Optional INT8 (dynamically quantized) model variant for CPU deploys
 """
 
 from __future__ import annotations
@@ -19,6 +20,40 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# File name written by ``engine.export --int8`` next to the FP model.
+INT8_MODEL_FILENAME = "model_int8.onnx"
+
+# CPU flags for the INT8 dot-product instructions ORT's quantized MatMul
+# kernels rely on.  Without them (pre-Cascade Lake / pre-Zen 4) dynamic INT8
+# runs slower than the FP model.
+_VNNI_FLAGS = frozenset({"avx512_vnni", "avx_vnni"})
+
+
+def cpu_supports_vnni(cpuinfo_path: str = "/proc/cpuinfo") -> bool | None:
+    """Return whether the host CPU advertises VNNI, or None if unknown."""
+    try:
+        with open(cpuinfo_path) as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return not _VNNI_FLAGS.isdisjoint(line.split(":", 1)[-1].split())
+    except OSError:
+        return None
+    return None
+
+
+def mean_pool(hidden_states: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """
+    Average token embeddings over non-padding positions.
+
+    The masked sum is a batched [1, S] @ [S, H] matmul, so it runs as a BLAS
+    reduction straight over ``hidden_states`` instead of materialising a
+    masked [B, S, H] copy first.
+    """
+    mask = attention_mask.astype(np.float32)
+    sum_embeddings = (mask[:, np.newaxis, :] @ hidden_states)[:, 0, :]
+    sum_mask = mask.sum(axis=1, keepdims=True).clip(min=1e-9)
+    return sum_embeddings / sum_mask
+
 
 class EmbeddingModel:
     """
@@ -37,6 +72,7 @@ class EmbeddingModel:
         normalize: bool = True,
         execution_provider: str = "CUDAExecutionProvider",
         num_threads: int = 4,
+        quantized: bool = False,
     ) -> None:
         self._model_path = model_path
         self._tokenizer_path = tokenizer_path
@@ -44,6 +80,8 @@ class EmbeddingModel:
         self._normalize = normalize
         self._execution_provider = execution_provider
         self._num_threads = num_threads
+        self._quantized = quantized
+        self._variant = "default"
 
         self._session = None
         self._tokenizer = None
@@ -78,17 +116,25 @@ class EmbeddingModel:
         logger.info("Tokenizer loaded from %s", self._tokenizer_path)
 
         # ── ONNX Session ────────────────────────────────────────────
+        # A BERT-style encoder is a single chain of MatMul-heavy ops, so all
+        # parallelism lives inside each op (intra-op).  Run the graph
+        # sequentially with one inter-op thread to avoid a second thread pool
+        # competing for the same cores.  num_threads=0 lets ORT use one
+        # thread per physical core.
         sess_opts = ort.SessionOptions()
         sess_opts.intra_op_num_threads = self._num_threads
+        sess_opts.inter_op_num_threads = 1
+        sess_opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
         sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
         sess_opts.log_severity_level = 3  # Warning+
 
         providers = self._resolve_providers()
-        logger.info("Loading ONNX model from %s with providers %s", self._model_path, providers)
+        model_path = self._resolve_model_path()
+        logger.info("Loading ONNX model from %s with providers %s", model_path, providers)
 
         t0 = time.monotonic()
         self._session = ort.InferenceSession(
-            self._model_path,
+            model_path,
             sess_options=sess_opts,
             providers=providers,
         )
@@ -97,13 +143,42 @@ class EmbeddingModel:
         # Probe embedding dimension with a dummy input
         self._embedding_dim = self._probe_embedding_dim()
         logger.info(
-            "Model loaded in %.0fms — embedding_dim=%d, max_seq_length=%d, provider=%s",
+            "Model loaded in %.0fms — embedding_dim=%d, max_seq_length=%d, provider=%s, variant=%s",
             load_ms,
             self._embedding_dim,
             self._max_seq_length,
             self._session.get_providers()[0],
+            self._variant,
         )
 
+    def _resolve_model_path(self) -> str:
+        """Pick the model file to load — the INT8 variant if requested and present."""
+        if not self._quantized:
+            self._variant = "default"
+            return self._model_path
+
+        if self._execution_provider == "CPUExecutionProvider" and cpu_supports_vnni() is False:
+            logger.warning(
+                "Quantized model requested but this CPU has no VNNI support — "
+                "INT8 would be slower than %s, loading that instead",
+                self._model_path,
+            )
+            self._variant = "default"
+            return self._model_path
+
+        candidate = Path(self._model_path).with_name(INT8_MODEL_FILENAME)
+        if candidate.is_file():
+            self._variant = "int8"
+            return str(candidate)
+
+        logger.warning(
+            "Quantized model requested but %s not found — falling back to %s",
+            candidate,
+            self._model_path,
+        )
+        self._variant = "default"
+        return self._model_path
+
     def _resolve_providers(self) -> list[str]:
         """Select execution providers based on configuration and availability."""
         import onnxruntime as ort
@@ -147,20 +222,41 @@ class EmbeddingModel:
         # last_hidden_state shape: [batch, seq_len, hidden_dim]
         return outputs[0].shape[-1]
 
+    def warmup(self, batch_size: int, seq_length: int) -> None:
+        """
+        Run one inference at a representative [batch_size, seq_length] shape.
+
+        ORT grows its memory arena (and, on CUDA, selects kernels) the first
+        time it sees a shape.  Paying that at startup keeps it out of the
+        first real batches.  *seq_length* is capped at ``max_seq_length``.
+        """
+        t0 = time.monotonic()
+        seq_length = min(seq_length, self._max_seq_length)
+        shape = (batch_size, seq_length)
+        input_ids = np.ones(shape, dtype=np.int64)
+        attention_mask = np.ones(shape, dtype=np.int64)
+        self._session.run(None, self._build_feed(input_ids, attention_mask))
+        logger.info(
+            "Warmup at batch=%d seq_len=%d completed in %.0fms",
+            batch_size,
+            seq_length,
+            (time.monotonic() - t0) * 1000,
+        )
+
     @property
     def embedding_dim(self) -> int:
         return self._embedding_dim
 
+    @property
+    def variant(self) -> str:
+        """Which model file is being served: ``"int8"`` or ``"default"``."""
+        return self._variant
+
     @property
     def is_loaded(self) -> bool:
         return self._session is not None
 
-    def count_tokens(self, text: str) -> int:
-        """Return the number of tokens for a given text using the loaded tokenizer."""
-        encoded = self._tokenizer.encode(text)
-        return len(encoded.ids)
-
-    def embed(self, texts: list[str]) -> np.ndarray:
+    def embed(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
         """
         Compute embeddings for a batch of texts.
 
@@ -168,7 +264,9 @@ class EmbeddingModel:
             texts: List of input strings.
 
         Returns:
-            numpy array of shape [len(texts), embedding_dim], float32.
+            ``(embeddings, token_counts)`` — a float32 array of shape
+            [len(texts), embedding_dim] and an int64 array with each text's
+            token count, taken from the attention mask used for inference.
         """
         if not self._session:
             raise RuntimeError("Model not loaded. Call load() first.")
@@ -187,15 +285,11 @@ class EmbeddingModel:
         hidden_states = outputs[0]
 
         # ── Mean Pooling ────────────────────────────────────────────
-        # Mask padding tokens before averaging
-        mask_expanded = attention_mask[:, :, np.newaxis].astype(np.float32)
-        sum_embeddings = (hidden_states * mask_expanded).sum(axis=1)
-        sum_mask = mask_expanded.sum(axis=1).clip(min=1e-9)
-        embeddings = sum_embeddings / sum_mask
+        embeddings = mean_pool(hidden_states, attention_mask)
 
         # ── Normalize ───────────────────────────────────────────────
         if self._normalize:
             norms = np.linalg.norm(embeddings, axis=1, keepdims=True).clip(min=1e-12)
-            embeddings = embeddings / norms
+            embeddings /= norms
 
-        return embeddings
+        return embeddings, attention_mask.sum(axis=1)
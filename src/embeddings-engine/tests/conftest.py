@@ -42,24 +42,27 @@ def _make_mock_model() -> MagicMock:
     Build a mock EmbeddingModel.
 
     embed(texts) returns a numpy array of shape [len(texts), EMBED_DIM]
-    filled with deterministic values so tests can assert on shapes.
+    filled with deterministic values so tests can assert on shapes, plus
+    per-text token counts (whitespace-split word counts).
     """
     model = MagicMock()
     model.is_loaded = True
     model.embedding_dim = EMBED_DIM
+    model.variant = "default"
 
-    def fake_embed(texts: list[str]) -> np.ndarray:
+    def fake_embed(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
         # Each text gets a unique-ish embedding based on its index
         n = len(texts)
         rng = np.random.RandomState(42)
         embs = rng.randn(n, EMBED_DIM).astype(np.float32)
         # L2 normalize like a real model
         norms = np.linalg.norm(embs, axis=1, keepdims=True).clip(min=1e-12)
-        return embs / norms
+        token_counts = np.array([len(t.split()) for t in texts], dtype=np.int64)
+        return embs / norms, token_counts
 
     model.embed.side_effect = fake_embed
     model.load.return_value = None
-    model.count_tokens.side_effect = lambda text: len(text.split())
+    model.warmup.return_value = None
     return model
 
 
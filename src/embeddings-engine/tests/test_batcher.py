@@ -17,10 +17,10 @@ def _make_mock_model() -> MagicMock:
     model.is_loaded = True
     model.embedding_dim = EMBED_DIM
 
-    def fake_embed(texts: list[str]) -> np.ndarray:
+    def fake_embed(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
         n = len(texts)
         embs = np.ones((n, EMBED_DIM), dtype=np.float32) * 0.1
-        return embs
+        return embs, np.array([len(t) for t in texts], dtype=np.int64)
 
     model.embed.side_effect = fake_embed
     return model
@@ -28,7 +28,7 @@ def _make_mock_model() -> MagicMock:
 
 @pytest.mark.asyncio
 async def test_batcher_single_submit():
-    """Submit a single text, get an embedding back."""
+    """Submit a single text, get an embedding and its token count back."""
     from engine.batcher import DynamicBatcher
 
     model = _make_mock_model()
@@ -36,9 +36,10 @@ async def test_batcher_single_submit():
     await batcher.start()
 
     try:
-        result = await batcher.submit("hello world")
+        result, n_tokens = await batcher.submit("hello world")
         assert isinstance(result, np.ndarray)
         assert result.shape == (EMBED_DIM,)
+        assert n_tokens == len("hello world")
     finally:
         await batcher.stop()
 
@@ -53,11 +54,12 @@ async def test_batcher_batch_submit():
     await batcher.start()
 
     try:
-        results = await batcher.submit_batch(["a", "b", "c"])
+        results = await batcher.submit_batch(["a", "bb", "ccc"])
         assert len(results) == 3
-        for r in results:
+        for r, _ in results:
             assert isinstance(r, np.ndarray)
             assert r.shape == (EMBED_DIM,)
+        assert [n for _, n in results] == [1, 2, 3]
     finally:
         await batcher.stop()
 
@@ -125,4 +127,4 @@ async def test_batcher_stop_drains():
 
     for f in futures:
         assert f.done()
-        assert isinstance(f.result(), np.ndarray)
+        assert isinstance(f.result()[0], np.ndarray)
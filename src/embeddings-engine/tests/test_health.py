@@ -14,6 +14,7 @@ def test_readyz_when_loaded(client):
     resp = client.get("/readyz")
     assert resp.status_code == 200
     assert resp.json()["status"] == "ready"
+    assert resp.json()["variant"] == "default"
 
 
 def test_models_lists_configured_model(client):
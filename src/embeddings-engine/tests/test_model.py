@@ -0,0 +1,58 @@
+"""Tests for EmbeddingModel helpers that don't need an ONNX session."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from engine.model import EmbeddingModel, cpu_supports_vnni, mean_pool
+
+
+def test_vnni_detected(tmp_path):
+    cpuinfo = tmp_path / "cpuinfo"
+    cpuinfo.write_text("processor\t: 0\nflags\t\t: fpu sse avx2 avx512f avx512_vnni\n")
+    assert cpu_supports_vnni(str(cpuinfo)) is True
+
+
+def test_vnni_missing(tmp_path):
+    cpuinfo = tmp_path / "cpuinfo"
+    cpuinfo.write_text("processor\t: 0\nflags\t\t: fpu sse avx2 avx512f\n")
+    assert cpu_supports_vnni(str(cpuinfo)) is False
+
+
+def test_vnni_unknown_without_cpuinfo(tmp_path):
+    assert cpu_supports_vnni(str(tmp_path / "missing")) is None
+
+
+def test_mean_pool_ignores_padding():
+    rng = np.random.default_rng(0)
+    hidden = rng.standard_normal((3, 5, 8)).astype(np.float32)
+    mask = np.array([[1, 1, 1, 1, 1], [1, 1, 0, 0, 0], [1, 0, 0, 0, 0]], dtype=np.int64)
+
+    pooled = mean_pool(hidden, mask)
+
+    assert pooled.shape == (3, 8)
+    assert pooled.dtype == np.float32
+    np.testing.assert_allclose(pooled[0], hidden[0].mean(axis=0), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(pooled[1], hidden[1, :2].mean(axis=0), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(pooled[2], hidden[2, 0], rtol=1e-5, atol=1e-6)
+
+
+def test_embed_returns_token_counts_from_attention_mask():
+    model = EmbeddingModel("/tmp/model.onnx", "/tmp/tokenizer.json")
+    model._tokenizer = MagicMock()
+    model._tokenizer.encode_batch.return_value = [
+        SimpleNamespace(ids=[101, 7, 8, 102], attention_mask=[1, 1, 1, 1]),
+        SimpleNamespace(ids=[101, 102, 0, 0], attention_mask=[1, 1, 0, 0]),
+    ]
+    model._session = MagicMock()
+    model._session.run.return_value = [np.ones((2, 4, 8), dtype=np.float32)]
+    model._required_inputs = {"input_ids", "attention_mask"}
+
+    embeddings, token_counts = model.embed(["a b", ""])
+
+    assert embeddings.shape == (2, 8)
+    assert token_counts.tolist() == [4, 2]
+    model._tokenizer.encode_batch.assert_called_once()
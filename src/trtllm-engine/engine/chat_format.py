@@ -82,8 +82,14 @@ def build_stream_chunk(
     completion_id: str,
     *,
     include_role: bool = False,
+    created: int | None = None,
 ) -> dict:
-    """Build an OpenAI ChatCompletion chunk for SSE streaming."""
+    """
+    Build an OpenAI ChatCompletion chunk for SSE streaming.
+
+    Pass *created* to stamp every chunk of a stream with the same time
+    (as OpenAI does); defaults to now.
+    """
     delta: dict[str, str] = {}
     if include_role:
         delta["role"] = "assistant"
@@ -93,7 +99,7 @@ def build_stream_chunk(
     return {
         "id": completion_id,
         "object": "chat.completion.chunk",
-        "created": int(time.time()),
+        "created": created if created is not None else int(time.time()),
         "model": model_name,
         "choices": [
             {
@@ -111,6 +117,7 @@ def build_usage_chunk(
     *,
     prompt_tokens: int,
     completion_tokens: int,
+    created: int | None = None,
 ) -> dict:
     """
     Build the final SSE chunk containing usage statistics.
@@ -122,7 +129,7 @@ def build_usage_chunk(
     return {
         "id": completion_id,
         "object": "chat.completion.chunk",
-        "created": int(time.time()),
+        "created": created if created is not None else int(time.time()),
         "model": model_name,
         "choices": [],
         "usage": {
@@ -47,6 +47,15 @@ class Settings(BaseSettings):
     # ── Streaming ───────────────────────────────────────────────────
     streaming_token_buffer_size: int = 1  # Flush every N tokens
 
+    # ── Transcription ───────────────────────────────────────────────
+    # Scratch directory for the audio file handed to ffmpeg.  Empty → use
+    # /dev/shm (RAM-backed tmpfs) when writable, else the system temp dir.
+    audio_tmp_dir: str = ""
+    # Transcriptions processed at once (ffmpeg decode overlaps inference).
+    max_concurrent_transcriptions: int = 4
+    # Transcriptions allowed to wait for a slot; beyond this → 429.
+    max_queued_transcriptions: int = 16
+
     # ── Backpressure ────────────────────────────────────────────────
     max_inflight_requests: int = 128  # 429 when exceeded
 
@@ -18,12 +18,12 @@ Common endpoints:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 import uuid
 from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse, Response, StreamingResponse
@@ -62,6 +62,15 @@ _runner: TRTLLMRunner | None = None
 _inflight: int = 0
 
 
+def _sse_event(data: dict) -> bytes:
+    """Encode one SSE ``data:`` event.
+
+    Called once per generated token while streaming, so it uses orjson
+    (serialises straight to bytes, several times faster than json.dumps).
+    """
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
 def _get_runner() -> TRTLLMRunner:
     if _runner is None or not _runner.is_loaded:
         raise HTTPException(status_code=503, detail="Engine not loaded")
@@ -89,6 +98,9 @@ async def lifespan(app: FastAPI):
             app,
             engine_dir=settings.engine_dir,
             tokenizer_dir=settings.tokenizer_dir,
+            audio_tmp_dir=settings.audio_tmp_dir,
+            max_concurrent=settings.max_concurrent_transcriptions,
+            max_queued=settings.max_queued_transcriptions,
         )
         logger.info(
             "Whisper engine ready — serving as '%s'", settings.model_name
@@ -188,6 +200,9 @@ async def chat_completions(request: Request):
     max_tokens = min(max_tokens, settings.max_output_len)
 
     # ── Apply chat template ────────────────────────────────────
+    # Rendered inline: it is cheap, and an await here would let a burst of
+    # requests slip past the backpressure gate above before any of them is
+    # counted in _inflight (and queue behind generations in the executor).
     prompt = apply_chat_template(messages, runner.tokenizer)
 
     request_id = uuid.uuid4().hex
@@ -277,6 +292,7 @@ async def _handle_streaming(
 ) -> StreamingResponse:
     """Handle streaming chat completion via SSE."""
     completion_id = f"chatcmpl-{request_id[:8]}"
+    created = int(time.time())  # Shared by every chunk of this stream
 
     # Count prompt tokens up-front — needed for usage chunk
     prompt_tokens = len(runner.tokenizer.encode(prompt))
@@ -307,10 +323,11 @@ async def _handle_streaming(
                 data = build_stream_chunk(
                     chunk, model_name, completion_id,
                     include_role=first,
+                    created=created,
                 )
                 first = False
 
-                yield f"data: {json.dumps(data)}\n\n"
+                yield _sse_event(data)
 
                 if chunk.finish_reason is not None:
                     break
@@ -322,10 +339,11 @@ async def _handle_streaming(
                     completion_id,
                     prompt_tokens=prompt_tokens,
                     completion_tokens=final_completion_tokens,
+                    created=created,
                 )
-                yield f"data: {json.dumps(usage_data)}\n\n"
+                yield _sse_event(usage_data)
 
-            yield "data: [DONE]\n\n"
+            yield b"data: [DONE]\n\n"
 
             duration = time.monotonic() - t_start
             REQUEST_DURATION.observe(duration)
@@ -343,8 +361,8 @@ async def _handle_streaming(
                     "code": "stream_failed",
                 }
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
-            yield "data: [DONE]\n\n"
+            yield _sse_event(error_data)
+            yield b"data: [DONE]\n\n"
 
         finally:
             INFLIGHT_REQUESTS.dec()
@@ -423,4 +441,9 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
+        # Single worker by design (see _inflight).  Pin the fast event loop
+        # and HTTP parser from uvicorn[standard] rather than relying on
+        # "auto", which silently falls back to asyncio/h11.
+        loop="uvloop",
+        http="httptools",
     )
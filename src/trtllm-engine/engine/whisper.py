@@ -31,20 +31,31 @@ Architecture:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
 import time
 from pathlib import Path
 
+import numpy as np
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 
+from engine.metrics import (
+    REJECTED_REQUESTS,
+    WHISPER_AUDIO_DURATION,
+    WHISPER_REQUEST_DURATION,
+    WHISPER_REQUESTS,
+)
 from engine.whisper_preprocessing import (
     N_SAMPLES,
     SAMPLE_RATE,
     compute_mel_spectrogram,
     decode_audio,
+    load_mel_filters,
     pad_or_trim,
+    resolve_tmp_dir,
 )
 
 logger = logging.getLogger(__name__)
@@ -54,6 +65,24 @@ router = APIRouter()
 # Max audio file size: 25 MB (matches OpenAI's limit)
 _MAX_AUDIO_BYTES = 25 * 1024 * 1024
 
+# Whisper language tags in token-ID order — a model with N languages uses
+# the first N.
+_LANGUAGES = (
+    "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
+    "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
+    "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
+    "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
+    "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
+    "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
+    "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
+    "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
+    "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
+    "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su", "yue",
+)
+
+# Special tokens (<|en|>, <|transcribe|>, ...) left in decoded output.
+_SPECIAL_TOKEN_RE = re.compile(r"<\|.*?\|>")
+
 
 class WhisperRunner:
     """
@@ -66,12 +95,18 @@ class WhisperRunner:
     with inflight batching — the recommended path per NVIDIA docs.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, tmp_dir: str | None = None) -> None:
         self._model_runner = None  # ModelRunnerCpp instance
         self._tokenizer = None  # tiktoken Encoding
         self._n_mels: int = 128  # Overridden from engine config
         self._eot_id: int = 0  # End-of-text token ID
-        self._assets_dir: str | None = None  # Path to mel_filters.npz
+        self._mel_filters = None  # (n_mels, 201) filterbank tensor on GPU
+        self._prompt_ids: dict[str, list[int]] = {}  # text prefix → token IDs
+        self._tmp_dir = tmp_dir  # Scratch dir for ffmpeg input files
+        # Serialises calls into the TRT-LLM runner.  Requests run on worker
+        # threads so ffmpeg decode of one request overlaps inference of another,
+        # but the runner itself is driven by one caller at a time.
+        self._infer_lock = threading.Lock()
         self._loaded = False
         self._stub = False
 
@@ -96,13 +131,20 @@ class WhisperRunner:
 
             engine_path = Path(engine_dir)
             assets_path = Path(tokenizer_dir)
-            self._assets_dir = str(assets_path)
 
             # ── Read encoder config ─────────────────────────────────
             encoder_config = _read_engine_config(engine_path / "encoder")
             self._n_mels = encoder_config.get("n_mels", 128)
             num_languages = encoder_config.get("num_languages", 99)
 
+            # ── Mel filterbank (once, resident on the GPU) ──────────
+            filters_file = assets_path / "mel_filters.npz"
+            self._mel_filters = load_mel_filters(
+                self._n_mels,
+                str(filters_file) if filters_file.exists() else None,
+                "cuda",
+            )
+
             # ── Read decoder config ─────────────────────────────────
             decoder_json_config = GptJsonConfig.parse_file(
                 str(engine_path / "decoder" / "config.json")
@@ -134,6 +176,7 @@ class WhisperRunner:
                 "cross_kv_cache_fraction": 0.5,
             }
             self._model_runner = ModelRunnerCpp.from_dir(**runner_kwargs)
+            self._warmup()
 
             self._loaded = True
             logger.info(
@@ -178,23 +221,21 @@ class WhisperRunner:
                 "text": "[stub] Transcription placeholder — TRT-LLM not installed.",
             }
 
-        import torch
-
         # ── 1. Decode audio ─────────────────────────────────────────
-        audio = decode_audio(audio_bytes)
+        audio = decode_audio(audio_bytes, tmp_dir=self._tmp_dir)
+
+        return self._transcribe_audio(audio, language=language)
+
+    def _transcribe_audio(self, audio: np.ndarray, *, language: str | None = None) -> dict:
+        """Run steps 2–5 of ``transcribe`` on already-decoded 16 kHz audio."""
+        import torch
 
         # ── 2. Mel spectrogram ──────────────────────────────────────
         audio = pad_or_trim(audio, N_SAMPLES)
-        mel_filters_path = None
-        if self._assets_dir:
-            candidate = Path(self._assets_dir) / "mel_filters.npz"
-            if candidate.exists():
-                mel_filters_path = str(candidate)
-
         mel = compute_mel_spectrogram(
             audio,
             n_mels=self._n_mels,
-            mel_filters_path=mel_filters_path,
+            mel_filters=self._mel_filters,
             device="cuda",
         )
         # Shape: (n_mels, T) → (1, n_mels, T) for batch dim
@@ -209,11 +250,7 @@ class WhisperRunner:
         )
 
         # ── 3. Build decoder prompt ─────────────────────────────────
-        text_prefix = _build_text_prefix(language=language)
-        prompt_ids = self._tokenizer.encode(
-            text_prefix,
-            allowed_special=self._tokenizer.special_tokens_set,
-        )
+        prompt_ids = self._decoder_prompt_ids(language)
         decoder_input_ids = torch.tensor([prompt_ids], dtype=torch.int32, device="cuda")
 
         # ── 4. Run encoder-decoder inference ────────────────────────
@@ -221,28 +258,67 @@ class WhisperRunner:
         #   mel → encoder → cross-attention → decoder with beam search
         mel_for_runner = mel.transpose(1, 2)  # (B, T, n_mels) for C++ runtime
 
-        outputs = self._model_runner.generate(
-            batch_input_ids=decoder_input_ids,
-            encoder_input_features=mel_for_runner,
-            encoder_output_lengths=mel_input_lengths // 2,  # downsampling factor
-            max_new_tokens=96,
-            end_id=self._eot_id,
-            pad_id=self._eot_id,
-            num_beams=1,
-            output_sequence_lengths=True,
-            return_dict=True,
-        )
-        torch.cuda.synchronize()
+        with self._infer_lock:
+            outputs = self._model_runner.generate(
+                batch_input_ids=decoder_input_ids,
+                encoder_input_features=mel_for_runner,
+                encoder_output_lengths=mel_input_lengths // 2,  # downsampling factor
+                max_new_tokens=96,
+                end_id=self._eot_id,
+                pad_id=self._eot_id,
+                num_beams=1,
+                output_sequence_lengths=True,
+                return_dict=True,
+            )
+            torch.cuda.synchronize()
 
         # ── 5. Decode output tokens ─────────────────────────────────
         output_ids = outputs["output_ids"].cpu().numpy().tolist()
         text = self._tokenizer.decode(output_ids[0][0]).strip()
 
         # Remove special tokens like <|startoftranscript|>, <|en|>, etc.
-        text = re.sub(r"<\|.*?\|>", "", text).strip()
+        text = _SPECIAL_TOKEN_RE.sub("", text).strip()
 
         return {"text": text}
 
+    def _warmup(self) -> None:
+        """
+        Run one transcription of silence before accepting traffic.
+
+        The first encoder/decoder pass pays for CUDA context setup, kernel
+        selection and KV-cache allocation; doing it here keeps that cost out
+        of the first user request (the readiness probe stays red until done).
+        """
+        t0 = time.monotonic()
+        try:
+            self._transcribe_audio(np.zeros(SAMPLE_RATE, dtype=np.float32))
+        except Exception:
+            logger.warning("Whisper warmup failed — first request will be slow", exc_info=True)
+            return
+        logger.info("Whisper warmup completed in %.2fs", time.monotonic() - t0)
+
+    def _decoder_prompt_ids(self, language: str | None) -> list[int]:
+        """
+        Return the decoder prompt token IDs for *language*.
+
+        The prefix depends only on language/task, so it is tokenized once
+        per distinct prefix and reused for every later request instead of
+        re-running tiktoken (with the full special-token set) each time.
+        Only known Whisper languages are cached — ``language`` is a raw form
+        field, and caching arbitrary values would let clients grow the
+        cache without bound.
+        """
+        text_prefix = _build_text_prefix(language=language)
+        prompt_ids = self._prompt_ids.get(text_prefix)
+        if prompt_ids is None:
+            prompt_ids = self._tokenizer.encode(
+                text_prefix,
+                allowed_special=self._tokenizer.special_tokens_set,
+            )
+            if language is None or language in _LANGUAGES:
+                self._prompt_ids[text_prefix] = prompt_ids
+        return prompt_ids
+
 
 # ── Helper functions ────────────────────────────────────────────────
 
@@ -312,20 +388,6 @@ def _build_whisper_special_tokens(num_languages: int) -> dict[str, int]:
     # Special tokens start after that
     base = 50257
 
-    # Language codes — first 'num_languages' language tags
-    _LANGUAGES = [
-        "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
-        "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
-        "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
-        "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
-        "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
-        "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
-        "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
-        "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
-        "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
-        "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su", "yue",
-    ]
-
     special: dict[str, int] = {}
     i = base
 
@@ -371,16 +433,32 @@ def _build_text_prefix(
 
 # Module-level runner instance — set by register_whisper_routes()
 _whisper: WhisperRunner | None = None
-
-
-def register_whisper_routes(app, engine_dir: str, tokenizer_dir: str) -> WhisperRunner:
+# Bounds transcriptions in flight (decoded audio + mel + GPU buffers each).
+_transcription_slots: asyncio.Semaphore | None = None
+# Transcriptions running or waiting for a slot, and the cap before 429.
+_transcriptions_pending: int = 0
+_max_pending_transcriptions: int = 0
+
+
+def register_whisper_routes(
+    app,
+    engine_dir: str,
+    tokenizer_dir: str,
+    audio_tmp_dir: str = "",
+    max_concurrent: int = 4,
+    max_queued: int = 16,
+) -> WhisperRunner:
     """
     Load the Whisper engine and register transcription routes on the app.
 
     Called from main.py lifespan when TRTLLM_MODALITY=transcription.
     """
-    global _whisper
-    _whisper = WhisperRunner()
+    global _whisper, _transcription_slots, _max_pending_transcriptions
+    _transcription_slots = asyncio.Semaphore(max_concurrent)
+    _max_pending_transcriptions = max_concurrent + max_queued
+    tmp_dir = resolve_tmp_dir(audio_tmp_dir)
+    logger.info("Whisper audio scratch dir: %s", tmp_dir or "system default")
+    _whisper = WhisperRunner(tmp_dir=tmp_dir)
     _whisper.load(engine_dir, tokenizer_dir)
     app.include_router(router)
     return _whisper
@@ -396,12 +474,7 @@ async def create_transcription(
     temperature: float | None = Form(default=None),
 ):
     """OpenAI-compatible audio transcription endpoint."""
-    from engine.metrics import (
-        WHISPER_AUDIO_DURATION,
-        WHISPER_REQUEST_DURATION,
-        WHISPER_REQUESTS,
-    )
-
+    global _transcriptions_pending
     if _whisper is None or not _whisper.is_loaded:
         raise HTTPException(status_code=503, detail="Whisper engine not loaded")
 
@@ -417,14 +490,37 @@ async def create_transcription(
     estimated_audio_secs = len(audio_bytes) / (SAMPLE_RATE * 2)
     WHISPER_AUDIO_DURATION.observe(min(estimated_audio_secs, 30.0))
 
+    # ── Backpressure gate ───────────────────────────────────────
+    # Fail fast once the wait queue is full rather than letting requests
+    # pile up behind the semaphore until the client times out.
+    if _transcriptions_pending >= _max_pending_transcriptions:
+        REJECTED_REQUESTS.labels(reason="overloaded").inc()
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": {
+                    "message": "Server overloaded — too many concurrent transcriptions.",
+                    "type": "rate_limit_error",
+                    "code": "rate_limit_exceeded",
+                }
+            },
+            headers={"Retry-After": "1"},
+        )
+
+    _transcriptions_pending += 1
     try:
         t_start = time.monotonic()
-        result = _whisper.transcribe(
-            audio_bytes,
-            language=language,
-            prompt=prompt,
-            temperature=temperature or 0.0,
-        )
+        # Run off the event loop (ffmpeg + GPU inference block for seconds),
+        # with at most max_concurrent_transcriptions in flight so a burst of
+        # uploads can't exhaust host/GPU memory.
+        async with _transcription_slots:
+            result = await asyncio.to_thread(
+                _whisper.transcribe,
+                audio_bytes,
+                language=language,
+                prompt=prompt,
+                temperature=temperature or 0.0,
+            )
         duration = time.monotonic() - t_start
 
         WHISPER_REQUESTS.labels(status="ok").inc()
@@ -449,3 +545,5 @@ async def create_transcription(
                 }
             },
         )
+    finally:
+        _transcriptions_pending -= 1
@@ -17,6 +17,7 @@ Dependencies:
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import tempfile
 from pathlib import Path
@@ -36,11 +37,35 @@ HOP_LENGTH = 160
 CHUNK_LENGTH = 30  # seconds
 N_SAMPLES = CHUNK_LENGTH * SAMPLE_RATE  # 480 000 samples in 30s
 
+# RAM-backed tmpfs present in every Linux container.  Only 64 MB by default
+# in Docker/K8s, so a few concurrent 25 MB uploads can fill it — writes that
+# run out of space fall back to the disk-backed default temp dir.
+_SHM_DIR = "/dev/shm"
+
+# Top-level atom types an ISO-BMFF/QuickTime file can start with.
+_ISOBMFF_LEADING_ATOMS = frozenset({b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide", b"pnot"})
+
+
+def resolve_tmp_dir(configured: str = "") -> str | None:
+    """
+    Pick the scratch directory for decode temp files.
+
+    Returns *configured* if set, else /dev/shm when it is a writable
+    directory, else None (``tempfile``'s default, usually disk-backed /tmp).
+    Resolve once at startup, not per request.
+    """
+    if configured:
+        return configured
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
 
 def decode_audio(
     audio_bytes: bytes,
     *,
     sr: int = SAMPLE_RATE,
+    tmp_dir: str | None = None,
 ) -> np.ndarray:
     """
     Decode audio bytes (any format) to 16 kHz mono float32 numpy array.
@@ -49,24 +74,89 @@ def decode_audio(
     Falls back to raw PCM interpretation if ffmpeg fails and the data looks
     like it could be raw 16-bit PCM.
 
+    Most formats are piped to ffmpeg's stdin; only containers that need a
+    seekable input (mp4/m4a) go through a temp file.
+
+    Args:
+        tmp_dir: Directory for the ffmpeg input file when one is needed
+            (see ``resolve_tmp_dir``).
+
     Returns:
         1-D float32 numpy array normalised to [-1, 1].
 
     Raises:
         RuntimeError: If the audio cannot be decoded.
     """
-    # Write bytes to a temp file so ffmpeg can read it.
-    # Using a temp file avoids pipe-buffering issues with large files.
-    with tempfile.NamedTemporaryFile(suffix=".audio", delete=False) as tmp:
-        tmp.write(audio_bytes)
-        tmp_path = tmp.name
+    if _needs_seekable_input(audio_bytes):
+        pcm_bytes = _decode_via_tempfile(audio_bytes, sr=sr, tmp_dir=tmp_dir)
+    else:
+        # Stream straight into ffmpeg's stdin — no temp-file write/read.
+        # subprocess.run(input=...) uses communicate(), which feeds stdin and
+        # drains stdout/stderr concurrently, so large inputs cannot deadlock.
+        pcm_bytes = _run_ffmpeg(["-i", "pipe:0"], sr=sr, stdin_bytes=audio_bytes)
+
+    if len(pcm_bytes) == 0:
+        raise RuntimeError("ffmpeg produced empty output — input may not contain audio.")
+
+    # Convert raw PCM to float32 — scale in place so a 30 s clip costs one
+    # float32 buffer rather than two (astype copy + division result).
+    audio = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
+
+
+def _needs_seekable_input(audio_bytes: bytes) -> bool:
+    """
+    True for containers ffmpeg cannot reliably decode from a pipe.
+
+    ISO-BMFF/QuickTime files (mp4/m4a/mov/3gp) may store their ``moov``
+    index after the audio data, which ffmpeg can only reach by seeking.  They
+    are recognised by the type of their first atom (at offset 4), which is
+    usually ``ftyp`` but can be another top-level atom in QuickTime/MOV and
+    some m4a files.  Everything else Whisper sees (wav, mp3, flac, ogg, webm)
+    decodes front-to-back.
+    """
+    return audio_bytes[4:8] in _ISOBMFF_LEADING_ATOMS
 
+
+def _decode_via_tempfile(audio_bytes: bytes, *, sr: int, tmp_dir: str | None) -> bytes:
+    """Write *audio_bytes* to a scratch file and decode it with ffmpeg."""
+    try:
+        tmp_path = _write_tempfile(audio_bytes, tmp_dir)
+    except OSError:
+        if tmp_dir is None:
+            raise
+        # Scratch dir full (e.g. /dev/shm under concurrent uploads) — retry
+        # on the default temp dir rather than failing the request.
+        logger.warning("Temp write to %s failed — falling back to default temp dir", tmp_dir, exc_info=True)
+        tmp_path = _write_tempfile(audio_bytes, None)
+
+    try:
+        return _run_ffmpeg(["-nostdin", "-i", tmp_path], sr=sr)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def _write_tempfile(audio_bytes: bytes, tmp_dir: str | None) -> str:
+    """Write *audio_bytes* to a new file in *tmp_dir*; remove it if the write fails."""
+    with tempfile.NamedTemporaryFile(suffix=".audio", dir=tmp_dir, delete=False) as tmp:
+        try:
+            tmp.write(audio_bytes)
+            tmp.flush()
+        except OSError:
+            tmp.close()
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+        return tmp.name
+
+
+def _run_ffmpeg(input_args: list[str], *, sr: int, stdin_bytes: bytes | None = None) -> bytes:
+    """Run ffmpeg on *input_args* and return raw 16-bit mono PCM at *sr*."""
     try:
         cmd = [
             "ffmpeg",
-            "-nostdin",
             "-threads", "0",
-            "-i", tmp_path,
+            *input_args,
             "-f", "s16le",      # Raw 16-bit signed little-endian PCM
             "-ac", "1",         # Mono
             "-acodec", "pcm_s16le",
@@ -75,11 +165,12 @@ def decode_audio(
         ]
         result = subprocess.run(
             cmd,
+            input=stdin_bytes,
             capture_output=True,
             check=True,
             timeout=60,  # Kill if stuck (corrupt files, etc.)
         )
-        pcm_bytes = result.stdout
+        return result.stdout
 
     except FileNotFoundError:
         raise RuntimeError(
@@ -93,15 +184,6 @@ def decode_audio(
         )
     except subprocess.TimeoutExpired:
         raise RuntimeError("Audio decoding timed out (>60s). File may be corrupt.")
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
-
-    if len(pcm_bytes) == 0:
-        raise RuntimeError("ffmpeg produced empty output — input may not contain audio.")
-
-    # Convert raw PCM to float32
-    audio = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-    return audio
 
 
 def pad_or_trim(
@@ -127,6 +209,7 @@ def compute_mel_spectrogram(
     n_mels: int = 128,
     *,
     mel_filters_path: Optional[str] = None,
+    mel_filters: torch.Tensor | None = None,
     device: str = "cuda",
     padding: int = 0,
 ) -> "torch.Tensor":
@@ -141,6 +224,9 @@ def compute_mel_spectrogram(
         n_mels: Number of mel bands (80 for whisper base/small, 128 for large-v3).
         mel_filters_path: Path to mel_filters.npz (OpenAI's precomputed filters).
                          If None, computes filters on the fly.
+        mel_filters: Preloaded (n_mels, N_FFT // 2 + 1) filterbank on *device*
+                     (see ``load_mel_filters``). Takes precedence over
+                     *mel_filters_path* and skips the per-call load.
         device: Torch device for computation ('cuda' or 'cpu').
         padding: Extra zero-padding samples to append before STFT.
 
@@ -170,7 +256,9 @@ def compute_mel_spectrogram(
     magnitudes = stft_out[..., :-1].abs() ** 2
 
     # Mel filterbank
-    filters = _get_mel_filters(n_mels, mel_filters_path, device)
+    filters = mel_filters
+    if filters is None:
+        filters = load_mel_filters(n_mels, mel_filters_path, device)
     mel_spec = filters @ magnitudes
 
     # Log scale (clamp to avoid log(0))
@@ -181,7 +269,7 @@ def compute_mel_spectrogram(
     return log_spec
 
 
-def _get_mel_filters(
+def load_mel_filters(
     n_mels: int,
     mel_filters_path: Optional[str],
     device: Union[str, "torch.device"],
@@ -229,22 +317,18 @@ def _compute_mel_filterbank(
     mel_points = torch.linspace(min_mel, max_mel, n_mels + 2, device=device)
     freq_points = _mel_to_hz(mel_points)
 
-    # Create triangular filters
-    filterbank = torch.zeros(n_mels, n_freqs, device=device)
-    for i in range(n_mels):
-        lower = freq_points[i]
-        center = freq_points[i + 1]
-        upper = freq_points[i + 2]
-
-        # Rising slope
-        up_slope = (all_freqs - lower) / (center - lower + 1e-10)
-        # Falling slope
-        down_slope = (upper - all_freqs) / (upper - center + 1e-10)
-
-        filterbank[i] = torch.maximum(
-            torch.zeros_like(all_freqs),
-            torch.minimum(up_slope, down_slope),
-        )
+    # Create triangular filters — all bands at once by broadcasting the
+    # (n_mels, 1) band edges against the (1, n_freqs) frequency grid.
+    lower = freq_points[:n_mels].unsqueeze(1)
+    center = freq_points[1 : n_mels + 1].unsqueeze(1)
+    upper = freq_points[2 : n_mels + 2].unsqueeze(1)
+
+    # Rising slope
+    up_slope = (all_freqs - lower) / (center - lower + 1e-10)
+    # Falling slope
+    down_slope = (upper - all_freqs) / (upper - center + 1e-10)
+
+    filterbank = torch.minimum(up_slope, down_slope).clamp_(min=0.0)
 
     # Slaney-style normalization
     enorm = 2.0 / (freq_points[2 : n_mels + 2] - freq_points[:n_mels])
@@ -128,6 +128,26 @@ def test_chat_streaming_include_usage(client):
     )
 
 
+def test_chat_streaming_chunks_share_created(client):
+    """Every chunk of one stream carries the same ``created`` timestamp."""
+    resp = client.post(
+        "/v1/chat/completions",
+        json={
+            "model": "test-model",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        },
+    )
+    data_lines = [dl for dl in resp.text.strip().split("\n") if dl.startswith("data: ")]
+    created = {
+        json.loads(line.removeprefix("data: "))["created"]
+        for line in data_lines
+        if line != "data: [DONE]"
+    }
+    assert len(created) == 1
+
+
 def test_chat_streaming_no_usage_by_default(client):
     """Without stream_options, no usage chunk should appear."""
     resp = client.post(
@@ -99,6 +99,20 @@ class TestTranscriptionEndpoint:
         )
         assert resp.status_code == 413
 
+    def test_full_queue_returns_429(self, whisper_client: TestClient, monkeypatch):
+        """Requests beyond running + queued capacity are rejected fast."""
+        from engine import whisper
+
+        monkeypatch.setattr(whisper, "_max_pending_transcriptions", 0)
+        resp = whisper_client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("test.wav", io.BytesIO(b"\x00" * 512), "audio/wav")},
+            data={"model": "whisper-large-v3"},
+        )
+        assert resp.status_code == 429
+        assert resp.headers["retry-after"] == "1"
+        assert resp.json()["error"]["code"] == "rate_limit_exceeded"
+
 
 class TestWhisperHealthProbes:
     """Health probes in transcription mode."""
@@ -138,3 +152,84 @@ class TestWhisperHealthProbes:
         )
         # 503 because _runner is None (we're in Whisper mode)
         assert resp.status_code == 503
+
+
+class TestDecoderPromptIds:
+    """Decoder prompt token IDs are cached per known language only."""
+
+    def _runner(self):
+        from unittest.mock import MagicMock
+
+        from engine.whisper import WhisperRunner
+
+        runner = WhisperRunner()
+        runner._tokenizer = MagicMock()
+        runner._tokenizer.encode.return_value = [1, 2, 3]
+        return runner
+
+    def test_known_language_cached(self):
+        runner = self._runner()
+
+        assert runner._decoder_prompt_ids("de") == [1, 2, 3]
+        assert runner._decoder_prompt_ids("de") == [1, 2, 3]
+        assert runner._tokenizer.encode.call_count == 1
+        assert len(runner._prompt_ids) == 1
+
+    def test_unknown_language_not_cached(self):
+        runner = self._runner()
+
+        assert runner._decoder_prompt_ids("not-a-language") == [1, 2, 3]
+        assert runner._prompt_ids == {}
+
+
+class TestAudioTmpDir:
+    """Scratch directory selection for ffmpeg input files."""
+
+    def test_configured_dir_wins(self):
+        from engine.whisper_preprocessing import resolve_tmp_dir
+
+        assert resolve_tmp_dir("/scratch") == "/scratch"
+
+    def test_uses_shm_when_writable(self, tmp_path, monkeypatch):
+        from engine import whisper_preprocessing
+
+        monkeypatch.setattr(whisper_preprocessing, "_SHM_DIR", str(tmp_path))
+        assert whisper_preprocessing.resolve_tmp_dir() == str(tmp_path)
+
+    def test_falls_back_to_system_default(self, tmp_path, monkeypatch):
+        from engine import whisper_preprocessing
+
+        monkeypatch.setattr(whisper_preprocessing, "_SHM_DIR", str(tmp_path / "missing"))
+        assert whisper_preprocessing.resolve_tmp_dir() is None
+
+    def test_only_mp4_family_needs_seekable_input(self):
+        from engine.whisper_preprocessing import _needs_seekable_input
+
+        assert _needs_seekable_input(b"\x00\x00\x00\x20ftypM4A \x00\x00\x00\x00")
+        # QuickTime/MOV and some m4a files lead with another top-level atom
+        assert _needs_seekable_input(b"\x00\x00\x00\x08wide\x00\x01\x00\x00mdat")
+        assert _needs_seekable_input(b"\x00\x00\x00\x6cmoov\x00\x00\x00\x6cmvhd")
+        assert not _needs_seekable_input(b"RIFF\x24\x00\x00\x00WAVEfmt ")
+        assert not _needs_seekable_input(b"ID3\x04\x00\x00\x00\x00\x00\x00")
+
+    def test_full_scratch_dir_falls_back_to_default(self, monkeypatch):
+        import errno
+
+        from engine import whisper_preprocessing
+
+        dirs = []
+        real_write = whisper_preprocessing._write_tempfile
+
+        def _write(audio_bytes, tmp_dir):
+            dirs.append(tmp_dir)
+            if tmp_dir is not None:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            return real_write(audio_bytes, tmp_dir)
+
+        monkeypatch.setattr(whisper_preprocessing, "_write_tempfile", _write)
+        monkeypatch.setattr(whisper_preprocessing, "_run_ffmpeg", lambda *a, **kw: b"\x00\x00")
+
+        pcm = whisper_preprocessing._decode_via_tempfile(b"audio", sr=16_000, tmp_dir="/dev/shm")
+
+        assert pcm == b"\x00\x00"
+        assert dirs == ["/dev/shm", None]